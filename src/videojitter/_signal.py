@@ -17,11 +17,28 @@ def duration(signal):
     return signal.samples.size / signal.sample_rate
 
 
-def downsample(signal, ratio, **kwargs):
-    """Downsamples the signal by the given integer ratio. Additional arguments are
-    passed to `scipy.signal.resample_poly()`."""
+def downsample(signal, ratio, signal_module=scipy.signal):
+    """Downsamples the signal by the given integer ratio.
+
+    This produces the same result as `scipy.signal.resample_poly()` with `up=1`, but
+    runs the anti-aliasing FIR filter through `scipy.signal.upfirdn()` directly, which
+    avoids padding the filter with an extra block of zero taps.
+
+    `signal_module` can be set to a `scipy.signal`-compatible module, such as
+    `cupyx.scipy.signal`, to process a signal whose samples are not a NumPy array."""
+    ratio = int(ratio)
+    # Same filter design as `scipy.signal.resample_poly()`. Note the filter half length
+    # is a multiple of `ratio`, which means the filter delay is a whole number of
+    # output samples.
+    half_length = 10 * ratio
+    kernel = signal_module.firwin(
+        2 * half_length + 1, 1 / ratio, window=("kaiser", 5.0)
+    ).astype(signal.samples.dtype)
+    output_start = half_length // ratio
     return Signal(
-        samples=scipy.signal.resample_poly(signal.samples, up=1, down=ratio, **kwargs),
+        samples=signal_module.upfirdn(kernel, signal.samples, down=ratio)[
+            output_start : output_start + -(-signal.samples.size // ratio)
+        ],
         sample_rate=signal.sample_rate / ratio,
     )
 
@@ -35,19 +52,26 @@ def upsample(signal, ratio, **kwargs):
     )
 
 
-def butter(signal, **kwargs):
+def butter(signal, steady_state=False, signal_module=scipy.signal, **kwargs):
     """Filters the signal using a Butterworth IIR filter. Additional arguments are
-    passed to `scipy.signal.butter()`."""
-    return signal._replace(
-        samples=scipy.signal.sosfilt(
-            scipy.signal.butter(
-                fs=signal.sample_rate,
-                output="sos",
-                **kwargs,
-            ),
-            signal.samples,
-        )
+    passed to `scipy.signal.butter()`.
+
+    If `steady_state` is True, the filter starts in the state it would be in if the
+    first sample value had been fed to it forever, which avoids a transient response at
+    the beginning of the signal.
+
+    `signal_module` has the same meaning as in `downsample()`."""
+    sos = signal_module.butter(
+        fs=signal.sample_rate,
+        output="sos",
+        **kwargs,
+    ).astype(signal.samples.dtype)
+    if not steady_state:
+        return signal._replace(samples=signal_module.sosfilt(sos, signal.samples))
+    samples, _ = signal_module.sosfilt(
+        sos, signal.samples, zi=signal_module.sosfilt_zi(sos) * signal.samples[0]
     )
+    return signal._replace(samples=samples)
 
 
 def firwin(sample_rate, pass_zero=True, **kwargs):
@@ -62,17 +86,6 @@ def firwin(sample_rate, pass_zero=True, **kwargs):
     return Signal(samples=kernel, sample_rate=sample_rate)
 
 
-def correlate(signal1, signal2, *kargs, **kwargs):
-    """Sample-rate-aware equivalent of `scipy.signal.correlate()`."""
-    assert signal1.sample_rate == signal2.sample_rate
-    return Signal(
-        samples=scipy.signal.correlate(
-            signal1.samples, signal2.samples, *kargs, **kwargs
-        ),
-        sample_rate=signal1.sample_rate,
-    )
-
-
 def convolve(signal1, signal2, *kargs, **kwargs):
     """Sample-rate-aware equivalent of `scipy.signal.convolve()`."""
     assert signal1.sample_rate == signal2.sample_rate
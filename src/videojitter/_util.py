@@ -15,6 +15,25 @@ def generate_windows(indexes, lookback, lookahead):
     return indexes[:, None] + np.arange(-lookback, lookahead + 1)[None, :]
 
 
+def find_nearest_indexes(sorted_values, values):
+    """For each value in `values`, returns the index of the nearest value in the
+    `sorted_values` array, which must be non-empty and sorted in ascending order.
+
+    Ties are resolved in favor of the higher index, matching the behavior of
+    `pandas.Index.get_indexer(method="nearest")`."""
+    assert sorted_values.size > 0
+    right_indexes = np.clip(
+        np.searchsorted(sorted_values, values), 1, sorted_values.size - 1
+    )
+    # With a single sorted value, both sides are that same value.
+    left_indexes = np.maximum(right_indexes - 1, 0)
+    return np.where(
+        values - sorted_values[left_indexes] < sorted_values[right_indexes] - values,
+        left_indexes,
+        right_indexes,
+    )
+
+
 def generate_frames(transition_count, delayed_transitions):
     """Generates an alternating frame sequence in the form of a boolean array.
 
@@ -30,22 +49,25 @@ def generate_frames(transition_count, delayed_transitions):
     For example, `generate_frames(6, [4])` will return FTFTFFTF, i.e. alternating
     between black and white 6 times, with the 4th transition (counting from zero) coming
     after a repeated black frame."""
-    frames = np.ones(transition_count + len(delayed_transitions) + 1, dtype=int)
-    frames[
+    # Every frame toggles the color, except for the repeated frames.
+    toggles = np.ones(transition_count + len(delayed_transitions) + 1, dtype=bool)
+    toggles[
         np.array(delayed_transitions, dtype=int)
         + 1  # because transition #0 occurs on frame #1
         + np.arange(len(delayed_transitions))
-    ] = 0
-    return ~(frames.cumsum() % 2).astype(bool)
+    ] = False
+    return ~np.logical_xor.accumulate(toggles)
 
 
 def generate_fake_recording(frames, fps_num, fps_den, sample_rate, frame_offsets=0):
     """Generates a recording signal simulating what an ideal instrument would output
     when faced with the given frame sequence.
     """
+    # Convert frames to sample values before expanding them, so that only one
+    # full-length array is allocated.
     return _signal.Signal(
         samples=np.repeat(
-            frames,
+            frames.astype(np.int8) * 2 - 1,
             np.diff(
                 np.round(
                     (np.arange(frames.size) + (1 + frame_offsets))
@@ -53,8 +75,6 @@ def generate_fake_recording(frames, fps_num, fps_den, sample_rate, frame_offsets
                 ).astype(np.int64),
                 prepend=0,
             ),
-        ).astype(np.int8)
-        * 2
-        - 1,
+        ),
         sample_rate=sample_rate,
     )
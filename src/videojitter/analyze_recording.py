@@ -367,10 +367,13 @@ class _Analyzer:
         return pattern
 
     def _correlate_pattern(self, recording, pattern):
-        correlation = _signal.correlate(
+        # Correlating with the pattern is the same as convolving with the time-reversed
+        # pattern. Since the pattern is much shorter than the recording, overlap-add
+        # convolution is faster than computing an FFT over the entire recording.
+        correlation = _signal.oaconvolve(
             recording,
             pattern._replace(
-                samples=(pattern.samples / pattern.samples.size).astype(
+                samples=(pattern.samples[::-1] / pattern.samples.size).astype(
                     recording.samples.dtype
                 )
             ),
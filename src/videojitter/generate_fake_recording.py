@@ -1,7 +1,11 @@
 import argparse
+from collections import namedtuple
 import sys
 import json
 import numpy as np
+import scipy.ndimage
+import scipy.optimize
+import scipy.signal
 import scipy.special
 from videojitter import _signal, _util, _version
 
@@ -163,6 +167,23 @@ def _parse_arguments():
         type=float,
         default=0.001,
     )
+    argument_parser.add_argument(
+        "--gaussian-filter-method",
+        help=(
+            'How to apply the gaussian filter. "fir" convolves the signal with a'
+            " gaussian kernel truncated at 5 standard deviations, whose cost grows with"
+            ' the standard deviation. "iir" approximates the gaussian filter using the'
+            " Young-van Vliet recursive filter run forwards and backwards, whose cost"
+            " does not depend on the standard deviation; the forward pass is also fused"
+            " with the high-pass filter. The IIR filter has the requested standard"
+            " deviation, but its step response differs from a true gaussian by up to"
+            " ~2%% of the step (~5%% for standard deviations of a few samples), and more"
+            " near the end of the signal. Standard deviations below half a sample"
+            ' always use "fir".'
+        ),
+        choices=["fir", "iir"],
+        default="fir",
+    )
     argument_parser.add_argument(
         "--high-pass-filter-hz",
         help=(
@@ -182,29 +203,106 @@ def _parse_arguments():
         type=float,
         default=0.00000005,
     )
+    argument_parser.add_argument(
+        "--device",
+        help=(
+            "Where to run the downsampling and filtering steps, which are the most"
+            ' expensive. "cuda" runs them on a NVIDIA GPU and requires CuPy 13 or'
+            " later to be installed."
+        ),
+        choices=["cpu", "cuda"],
+        default="cpu",
+    )
     argument_parser.add_argument(
         "--output-sample-type",
         help=(
             'Output sample format as a python-soundfile subtype, e.g. "PCM_16",'
-            ' "PCM_24", "FLOAT".'
+            ' "PCM_24", "FLOAT". Integer formats clip samples beyond full scale; use'
+            ' "FLOAT" to preserve them.'
         ),
-        default="FLOAT",
+        default="PCM_16",
     )
-    return argument_parser.parse_args()
-
-
-def _apply_gaussian_filter(samples, stddev_samples):
-    kernel = scipy.signal.windows.gaussian(
-        M=int(np.round(stddev_samples * 10)),
-        std=stddev_samples,
-    ).astype(samples.dtype)
-    return scipy.signal.convolve(
-        samples,
-        kernel / np.sum(kernel),
-        mode="same",
+    args = argument_parser.parse_args()
+    try:
+        args.device = _get_device(args.device)
+    except ImportError as exception:
+        argument_parser.error(
+            f"--device {args.device} requires CuPy 13 or later to be installed"
+            f" ({exception})"
+        )
+    return args
+
+
+_Device = namedtuple("_Device", ["asarray", "asnumpy", "signal", "ndimage"])
+
+
+def _get_device(name):
+    if name == "cpu":
+        return _Device(
+            asarray=np.asarray,
+            asnumpy=np.asarray,
+            signal=scipy.signal,
+            ndimage=scipy.ndimage,
+        )
+    assert name == "cuda"
+    # CuPy is an optional dependency, so only import it if it is actually needed.
+    # pylint: disable=import-outside-toplevel,import-error
+    import cupy
+    import cupyx.scipy.ndimage
+    import cupyx.scipy.signal
+
+    if int(cupy.__version__.split(".", 1)[0]) < 13:
+        raise ImportError(f"found CuPy {cupy.__version__}")
+    return _Device(
+        asarray=cupy.asarray,
+        asnumpy=cupy.asnumpy,
+        signal=cupyx.scipy.signal,
+        ndimage=cupyx.scipy.ndimage,
+    )
+
+
+def _apply_gaussian_filter(samples, stddev_samples, ndimage_module=scipy.ndimage):
+    # Truncating at 5 standard deviations on either side results in a kernel that is
+    # about 10 standard deviations long.
+    return ndimage_module.gaussian_filter1d(
+        samples, sigma=stddev_samples, truncate=5.0, mode="nearest"
     )
 
 
+def _get_recursive_gaussian_denominator(q):
+    # From I.T. Young, L.J. van Vliet, "Recursive implementation of the Gaussian
+    # filter", Signal Processing 44 (1995) 139-151. The coefficients are derived from
+    # the pole form given in the paper (as opposed to the rounded polynomial
+    # coefficients also given there, which are not self-consistent and result in
+    # significant errors for large `q`).
+    m0, m1, m2 = 1.16680, 1.10783, 1.40586
+    m1m2 = m1**2 + m2**2
+    b0 = (m0 + q) * (m1m2 + 2 * m1 * q + q**2)
+    b1 = q * (2 * m0 * m1 + m1m2 + (2 * m0 + 4 * m1) * q + 3 * q**2)
+    b2 = -(q**2) * (m0 + 2 * m1 + 3 * q)
+    b3 = q**3
+    return np.array([1, -b1 / b0, -b2 / b0, -b3 / b0])
+
+
+def _get_recursive_gaussian_sos(stddev_samples):
+    """Returns the second-order sections of a third order all-pole causal filter
+    which, when run forwards and then backwards, approximates a zero-phase gaussian
+    filter with the given standard deviation."""
+
+    # Rather than using the approximate formula from the paper to derive the scale
+    # parameter `q` from the standard deviation, which results in a ~7% error, choose
+    # `q` such that the variance of the impulse response matches exactly. A causal
+    # filter with real or complex conjugate poles `p` and unit DC gain has an impulse
+    # response variance of sum(p/(1-p)^2); running it backwards doubles that.
+    def variance_error(q):
+        poles = np.roots(_get_recursive_gaussian_denominator(q))
+        return 2 * np.real(np.sum(poles / (1 - poles) ** 2)) - stddev_samples**2
+
+    q = scipy.optimize.brentq(variance_error, 1e-3, 2 * stddev_samples + 10)
+    denominator = _get_recursive_gaussian_denominator(q)
+    return scipy.signal.tf2sos([np.sum(denominator)], denominator)
+
+
 def _get_pattern_frame_offset_adjustments(frame_count, pattern_count, start):
     # The goal here is to generate a pattern that looks like a "sawtooth" on the
     # resulting chart. From a mathematical perspective this is surprisingly tricky,
@@ -255,23 +353,22 @@ def _get_pattern_frame_offset_adjustments(frame_count, pattern_count, start):
     # surprisingly hard. See the generator-pattern.ipynb Jupyter notebook for an
     # overview of the math that was used to arrive at the formulas for Y(n)
     # (`frame_offset_adjustments`) and `end` that are used in this code.
-    period_frames = frame_count // pattern_count
+    period_frames = int(frame_count // pattern_count)
+    period_count = int(pattern_count)
     offset_into_cycle = np.arange(0, period_frames) / period_frames
     end = -np.real(scipy.special.lambertw(-start * np.exp(-start), -1))
-    frame_offset_adjustments = np.tile(
-        (
-            start * ((end / start) ** offset_into_cycle - 1) / np.log(end / start)
-            - offset_into_cycle
-        )
-        * period_frames,
-        int(pattern_count),
-    )
+    frame_offset_adjustments = (
+        start * ((end / start) ** offset_into_cycle - 1) / np.log(end / start)
+        - offset_into_cycle
+    ) * period_frames
 
-    frame_index = (frame_count - frame_offset_adjustments.size) // 2
+    # Rather than tiling the single period computed above into a temporary array,
+    # broadcast it directly into every period of the output.
+    frame_index = (frame_count - period_frames * period_count) // 2
     all_frame_offset_adjustments = np.zeros(frame_count)
     all_frame_offset_adjustments[
-        frame_index : frame_index + frame_offset_adjustments.size
-    ] = frame_offset_adjustments
+        frame_index : frame_index + period_frames * period_count
+    ].reshape(period_count, period_frames)[:] = frame_offset_adjustments
     return all_frame_offset_adjustments
 
 
@@ -280,11 +377,16 @@ class _Generator:
         self._args = args
         with open(args.spec_file, encoding="utf-8") as spec_file:
             self._spec = json.load(spec_file)
+        self._device = args.device
 
     def generate(self):
         frames = self._generate_frames()
 
         assert self._args.internal_sample_rate_hz > self._args.output_sample_rate_hz
+        # Note there is no need to round the internal sample rate or the signal length
+        # to FFT-friendly (5-smooth) values: downsampling is done using a direct
+        # polyphase FIR filter (see `_signal.downsample()`), whose cost does not depend
+        # on the factorization of either.
         downsample_ratio = int(
             np.ceil(
                 self._args.internal_sample_rate_hz / self._args.output_sample_rate_hz
@@ -300,12 +402,19 @@ class _Generator:
         )
         recording = self._add_padding(recording)
         recording = self._add_pwm(recording)
-        recording = _signal.downsample(recording, downsample_ratio)
+        recording = recording._replace(samples=self._device.asarray(recording.samples))
+        recording = _signal.downsample(
+            recording, downsample_ratio, signal_module=self._device.signal
+        )
         recording = recording._replace(
             samples=(recording.samples + self._args.dc_offset) * self._args.gain
         )
-        recording = self._gaussian_filter(recording)
-        recording = self._high_pass_filter(recording)
+        if self._args.gaussian_filter_method == "iir":
+            recording = self._recursive_gaussian_and_high_pass_filter(recording)
+        else:
+            recording = self._gaussian_filter(recording)
+            recording = self._high_pass_filter(recording)
+        recording = recording._replace(samples=self._device.asnumpy(recording.samples))
         recording = self._add_noise(recording)
 
         _signal.tofile(
@@ -320,19 +429,24 @@ class _Generator:
         )
 
     def _get_frame_offsets(self, frames):
-        return (
-            (
-                _get_pattern_frame_offset_adjustments(
-                    frames.size,
-                    self._args.pattern_count,
-                    self._args.pattern_min_interval,
-                )
-                if self._args.pattern_count
-                else 0
+        frame_offsets = (
+            _get_pattern_frame_offset_adjustments(
+                frames.size,
+                self._args.pattern_count,
+                self._args.pattern_min_interval,
             )
-            + frames * self._args.white_duration_overshoot
-            + (np.arange(frames.size) % 2 == 0) * self._args.even_duration_overshoot
+            if self._args.pattern_count
+            else np.zeros(frames.size)
         )
+        # Add the overshoots in place so that no other frame-sized array is allocated.
+        np.add(
+            frame_offsets,
+            self._args.white_duration_overshoot,
+            out=frame_offsets,
+            where=frames,
+        )
+        frame_offsets[::2] += self._args.even_duration_overshoot
+        return frame_offsets
 
     def _generate_ideal_recording(self, frames, frame_offsets, sample_rate):
         recording = _util.generate_fake_recording(
@@ -353,61 +467,41 @@ class _Generator:
         end_padding_samples = int(
             np.round(self._args.end_padding_seconds * recording.sample_rate)
         )
-        recording = recording._replace(
-            samples=np.concatenate(
-                (
-                    (
-                        np.full(
-                            begin_padding_samples,
-                            self._args.padding_signal_level,
-                            dtype=recording.samples.dtype,
-                        )
-                        if begin_padding_samples > 0
-                        else []
-                    ),
-                    recording.samples,
-                    (
-                        np.full(
-                            end_padding_samples,
-                            self._args.padding_signal_level,
-                            dtype=recording.samples.dtype,
-                        )
-                        if end_padding_samples > 0
-                        else []
-                    ),
-                )
+        # Truncate first, then write the result into a buffer that is already filled
+        # with the padding, so that only one full-length array is allocated.
+        samples = recording.samples[
+            max(-begin_padding_samples, 0) : (
+                end_padding_samples if end_padding_samples < 0 else None
             )
+        ]
+        samples_start = max(begin_padding_samples, 0)
+        padded_samples = np.full(
+            samples_start + samples.size + max(end_padding_samples, 0),
+            self._args.padding_signal_level,
+            dtype=recording.samples.dtype,
         )
-        return recording._replace(
-            samples=recording.samples[
-                -begin_padding_samples if begin_padding_samples < 0 else 0 : (
-                    end_padding_samples if end_padding_samples < 0 else None
-                )
-            ]
-        )
+        padded_samples[samples_start : samples_start + samples.size] = samples
+        return recording._replace(samples=padded_samples)
 
     def _add_pwm(self, recording):
         if self._args.pwm_frequency_fps == 0:
             return recording
+        # When PWM is off, the light is off, which is the same as a black frame. PWM is
+        # on during the first `pwm_duty_cycle` fraction of each PWM cycle, like
+        # `scipy.signal.square()` but with fewer intermediate arrays.
+        pwm_cycles_per_sample = (
+            self._args.pwm_frequency_fps
+            * self._spec["fps"]["num"]
+            / self._spec["fps"]["den"]
+            / recording.sample_rate
+        )
         return recording._replace(
-            samples=(recording.samples + 1)
-            * (
-                scipy.signal.square(
-                    np.arange(recording.samples.size)
-                    * (
-                        2
-                        * np.pi
-                        * self._args.pwm_frequency_fps
-                        * self._spec["fps"]["num"]
-                        / self._spec["fps"]["den"]
-                        / recording.sample_rate
-                    ),
-                    self._args.pwm_duty_cycle,
-                )
-                * 0.5
-                + 0.5
+            samples=np.where(
+                np.arange(recording.samples.size) * pwm_cycles_per_sample % 1
+                < self._args.pwm_duty_cycle,
+                recording.samples,
+                recording.samples.dtype.type(-1),
             )
-            - 1
         )
 
     def _gaussian_filter(self, recording):
@@ -418,14 +512,69 @@ class _Generator:
         )
         return recording._replace(
             samples=_apply_gaussian_filter(
-                recording.samples, gaussian_filter_stddev_samples
+                recording.samples,
+                gaussian_filter_stddev_samples,
+                ndimage_module=self._device.ndimage,
             )
         )
 
+    def _recursive_gaussian_and_high_pass_filter(self, recording):
+        gaussian_filter_stddev_samples = (
+            self._args.gaussian_filter_stddev_seconds * recording.sample_rate
+        )
+        # The recursive filter is a poor approximation of very narrow gaussians, whose
+        # FIR kernels are cheap anyway.
+        if gaussian_filter_stddev_samples < 0.5:
+            return self._high_pass_filter(self._gaussian_filter(recording))
+        sos = _get_recursive_gaussian_sos(gaussian_filter_stddev_samples)
+        # The high-pass filter is causal, so it can't be part of the backward pass. But
+        # since both filters are linear and time-invariant, the order in which they
+        # are applied doesn't matter, so the high-pass filter can be cascaded with the
+        # forward pass instead, which saves a full pass over the signal.
+        forward_sos = (
+            np.concatenate([
+                sos,
+                scipy.signal.butter(
+                    N=1,
+                    Wn=self._args.high_pass_filter_hz,
+                    btype="highpass",
+                    fs=recording.sample_rate,
+                    output="sos",
+                ),
+            ])
+            if self._args.high_pass_filter_hz
+            else sos
+        )
+        signal_module = self._device.signal
+        # Keep the filter coefficients in double precision, which also makes the
+        # filter run in double precision. For large standard deviations the poles are
+        # very close to the unit circle, which single precision cannot represent
+        # accurately enough.
+        forward_sos = self._device.asarray(forward_sos)
+        backward_sos = self._device.asarray(sos)
+        # Start both passes in steady state, as if the first (resp. last) sample value
+        # extended forever.
+        samples, _ = signal_module.sosfilt(
+            forward_sos,
+            recording.samples,
+            zi=signal_module.sosfilt_zi(forward_sos) * recording.samples[0],
+        )
+        samples, _ = signal_module.sosfilt(
+            backward_sos,
+            samples[::-1],
+            zi=signal_module.sosfilt_zi(backward_sos) * samples[-1],
+        )
+        return recording._replace(samples=samples[::-1].astype(recording.samples.dtype))
+
     def _high_pass_filter(self, recording):
         return (
             _signal.butter(
-                recording, N=1, Wn=self._args.high_pass_filter_hz, btype="highpass"
+                recording,
+                steady_state=True,
+                signal_module=self._device.signal,
+                N=1,
+                Wn=self._args.high_pass_filter_hz,
+                btype="highpass",
             )
             if self._args.high_pass_filter_hz
             else recording
@@ -435,9 +584,11 @@ class _Generator:
         return (
             recording._replace(
                 samples=recording.samples
-                + np.random.default_rng(0).normal(
-                    scale=self._args.noise_rms_per_hz * recording.sample_rate / 2,
-                    size=recording.samples.size,
+                + np.random.default_rng(0).standard_normal(
+                    size=recording.samples.size, dtype=recording.samples.dtype
+                )
+                * recording.samples.dtype.type(
+                    self._args.noise_rms_per_hz * recording.sample_rate / 2
                 )
             )
             if self._args.noise_rms_per_hz
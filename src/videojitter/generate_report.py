@@ -9,6 +9,13 @@ from si_prefix import si_format
 from videojitter import _util, _version
 
 
+def _positive_int(value):
+    value = int(value)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return value
+
+
 def _parse_arguments():
     argument_parser = argparse.ArgumentParser(
         description="Given an edges file, produces a summary of the data.",
@@ -79,6 +86,25 @@ def _parse_arguments():
         type=float,
         default=0.100,
     )
+    argument_parser.add_argument(
+        "--chart-binning-threshold",
+        help=(
+            "If set, and there are at least this many transitions, the chart shows the"
+            " minimum, mean and maximum time between transitions within each of"
+            " --chart-bin-count time bins, instead of every individual transition."
+            " This makes charts of long recordings much smaller and faster to render,"
+            " at the cost of not being able to inspect individual transitions. Invalid"
+            " and intentionally delayed transitions are excluded from the bins."
+        ),
+        type=int,
+        default=argparse.SUPPRESS,
+    )
+    argument_parser.add_argument(
+        "--chart-bin-count",
+        help="How many time bins to use when the chart is binned",
+        type=_positive_int,
+        default=2000,
+    )
     argument_parser.add_argument(
         "--keep-first-transition",
         help=(
@@ -150,6 +176,199 @@ def _packed_columns_chart(data, *kargs, **kwargs):
     return alt.Chart(data, *kargs, **kwargs).transform_flatten(data.columns.values)
 
 
+def _time_since_first_transition_x(field, time_start_seconds, time_end_seconds):
+    return (
+        alt.X(field, type="quantitative")
+        .scale(
+            zero=False,
+            nice=False,
+            **(
+                {"domainMin": time_start_seconds}
+                if time_start_seconds is not None
+                else {}
+            ),
+            **({"domainMax": time_end_seconds} if time_end_seconds is not None else {}),
+        )
+        .axis(
+            labelExpr=alt.expr.format(alt.datum.value, "~s") + "s",
+            title="Time since first transition",
+        )
+    )
+
+
+def _time_since_previous_transition_y(
+    field,
+    minimum_time_between_transitions_seconds,
+    maximum_time_between_transitions_seconds,
+):
+    return (
+        alt.Y(field, type="quantitative")
+        .scale(
+            zero=False,
+            domain=[
+                minimum_time_between_transitions_seconds,
+                maximum_time_between_transitions_seconds,
+            ],
+            clamp=True,
+        )
+        .axis(
+            labelExpr=alt.expr.format(alt.datum.value, "~s") + "s",
+            title="Time since previous transition",
+        )
+    )
+
+
+def _finish_chart(chart, fine_print):
+    return (
+        alt.vconcat(
+            chart.add_params(
+                # Make the chart zoomable on the X axis.
+                # Note we don't let the user zoom the Y axis, as they would then end up
+                # scaling both axes simultaneously, which does not really make sense
+                # (the aspect ratio of this chart is arbitrary anyway) and is more
+                # annoying than useful when attempting to keep outliers within the range
+                # of the chart.
+                alt.selection_interval(
+                    name="x_interval", encodings=["x"], bind="scales"
+                ),
+            ),
+            alt.Chart(
+                title=alt.TitleParams(
+                    fine_print,
+                    fontSize=10,
+                    fontWeight="normal",
+                    anchor="start",
+                )
+            ).mark_text(),
+        )
+        .resolve_scale(color="independent", opacity="independent")
+        .properties(
+            usermeta={
+                "embedOptions": {
+                    "downloadFileName": "videojitter",
+                    # Sets the Vega-Embed PNG export scale factor to provide
+                    # higher-quality exports. See:
+                    #   https://github.com/vega/vega-embed/issues/492
+                    "scaleFactor": 2,
+                }
+            }
+        )
+    )
+
+
+def _bin_transitions(
+    transitions, first_transition_recording_timestamp_seconds, bin_count
+):
+    """Aggregates the time since previous transition of `transitions` into `bin_count`
+    time bins of equal width spanning from the first to the last transition.
+    `transitions` must not be empty.
+
+    The returned DataFrame contains one row per non-empty bin, in time order."""
+    time_since_first_transition = (
+        transitions.recording_timestamp_seconds.values
+        - first_transition_recording_timestamp_seconds
+    )
+    bin_width_seconds = max(time_since_first_transition.max(), 0) / bin_count
+    bin_indexes = (
+        # Clip at zero as well, in case the timestamps of `transitions` are rounded
+        # and the first one was rounded down.
+        np.clip(time_since_first_transition // bin_width_seconds, 0, bin_count - 1)
+        if bin_width_seconds > 0
+        else np.zeros(time_since_first_transition.size)
+    )
+    bins = transitions.time_since_previous_transition_seconds.groupby(bin_indexes).agg([
+        "min", "mean", "max", "count"
+    ])
+    return pd.DataFrame({
+        "time_since_first_transition": (bins.index.values + 0.5) * bin_width_seconds,
+        "bin_start_seconds": bins.index.values * bin_width_seconds,
+        "bin_end_seconds": (bins.index.values + 1) * bin_width_seconds,
+        "minimum_time_since_previous_transition_seconds": bins["min"].values,
+        "mean_time_since_previous_transition_seconds": bins["mean"].values,
+        "maximum_time_since_previous_transition_seconds": bins["max"].values,
+        "transition_count": bins["count"].values,
+    })
+
+
+def _generate_binned_chart(
+    bins,
+    title,
+    time_start_seconds,
+    time_end_seconds,
+    minimum_time_between_transitions_seconds,
+    maximum_time_between_transitions_seconds,
+    fine_print,
+):
+    base = _packed_columns_chart(
+        # Stop Altair from outputting NaNs, which is not valid JSON. See
+        # https://github.com/altair-viz/altair/issues/2301
+        bins.replace({np.nan: None}),
+    ).encode(
+        _time_since_first_transition_x(
+            "time_since_first_transition", time_start_seconds, time_end_seconds
+        ),
+        tooltip=[
+            alt.Tooltip(
+                "bin_start_seconds",
+                type="quantitative",
+                title="From (s since first transition)",
+                format="~s",
+            ),
+            alt.Tooltip(
+                "bin_end_seconds",
+                type="quantitative",
+                title="To (s since first transition)",
+                format="~s",
+            ),
+            alt.Tooltip(
+                "transition_count",
+                type="quantitative",
+                title="Transitions",
+            ),
+            alt.Tooltip(
+                "minimum_time_since_previous_transition_seconds",
+                type="quantitative",
+                title="Min. time since prev. transition (s)",
+                format="~s",
+            ),
+            alt.Tooltip(
+                "mean_time_since_previous_transition_seconds",
+                type="quantitative",
+                title="Mean time since prev. transition (s)",
+                format="~s",
+            ),
+            alt.Tooltip(
+                "maximum_time_since_previous_transition_seconds",
+                type="quantitative",
+                title="Max. time since prev. transition (s)",
+                format="~s",
+            ),
+        ],
+    )
+    return _finish_chart(
+        alt.layer(
+            base.mark_area(opacity=0.3).encode(
+                _time_since_previous_transition_y(
+                    "minimum_time_since_previous_transition_seconds",
+                    minimum_time_between_transitions_seconds,
+                    maximum_time_between_transitions_seconds,
+                ),
+                alt.Y2("maximum_time_since_previous_transition_seconds"),
+            ),
+            base.mark_line().encode(
+                _time_since_previous_transition_y(
+                    "mean_time_since_previous_transition_seconds",
+                    minimum_time_between_transitions_seconds,
+                    maximum_time_between_transitions_seconds,
+                )
+            ),
+            title=title,
+            name="chart",
+        ).properties(width=1000, height=750),
+        fine_print,
+    )
+
+
 def _generate_chart(
     transitions,
     title,
@@ -216,37 +435,13 @@ def _generate_chart(
         )
         .mark_point(filled=True)
         .encode(
-            alt.X("time_since_first_transition", type="quantitative")
-            .scale(
-                zero=False,
-                nice=False,
-                **(
-                    {"domainMin": time_start_seconds}
-                    if time_start_seconds is not None
-                    else {}
-                ),
-                **(
-                    {"domainMax": time_end_seconds}
-                    if time_end_seconds is not None
-                    else {}
-                ),
-            )
-            .axis(
-                labelExpr=alt.expr.format(alt.datum.value, "~s") + "s",
-                title="Time since first transition",
+            _time_since_first_transition_x(
+                "time_since_first_transition", time_start_seconds, time_end_seconds
             ),
-            alt.Y("time_since_previous_transition_seconds", type="quantitative")
-            .scale(
-                zero=False,
-                domain=[
-                    minimum_time_between_transitions_seconds,
-                    maximum_time_between_transitions_seconds,
-                ],
-                clamp=True,
-            )
-            .axis(
-                labelExpr=alt.expr.format(alt.datum.value, "~s") + "s",
-                title="Time since previous transition",
+            _time_since_previous_transition_y(
+                "time_since_previous_transition_seconds",
+                minimum_time_between_transitions_seconds,
+                maximum_time_between_transitions_seconds,
             ),
             alt.Color(
                 "label",
@@ -367,41 +562,7 @@ def _generate_chart(
                 title="Intentionally delayed",
             )
         )
-    return (
-        alt.vconcat(
-            chart.encode(tooltip=tooltips).add_params(
-                # Make the chart zoomable on the X axis.
-                # Note we don't let the user zoom the Y axis, as they would then end up
-                # scaling both axes simultaneously, which does not really make sense
-                # (the aspect ratio of this chart is arbitrary anyway) and is more
-                # annoying than useful when attempting to keep outliers within the range
-                # of the chart.
-                alt.selection_interval(
-                    name="x_interval", encodings=["x"], bind="scales"
-                ),
-            ),
-            alt.Chart(
-                title=alt.TitleParams(
-                    fine_print,
-                    fontSize=10,
-                    fontWeight="normal",
-                    anchor="start",
-                )
-            ).mark_text(),
-        )
-        .resolve_scale(color="independent", opacity="independent")
-        .properties(
-            usermeta={
-                "embedOptions": {
-                    "downloadFileName": "videojitter",
-                    # Sets the Vega-Embed PNG export scale factor to provide
-                    # higher-quality exports. See:
-                    #   https://github.com/vega/vega-embed/issues/492
-                    "scaleFactor": 2,
-                }
-            }
-        )
-    )
+    return _finish_chart(chart.encode(tooltip=tooltips), fine_print)
 
 
 def _mean_without_outliers(x):
@@ -439,18 +600,18 @@ def _match_delayed_transitions(
     # This should work in all but the most pathological cases (e.g. time-varying clock
     # skew).
     delayed_transition_indexes = np.array(delayed_transition_indexes)
+    recording_timestamp_seconds = transitions.recording_timestamp_seconds.values
+    first_timestamp_seconds = recording_timestamp_seconds.min()
+    last_timestamp_seconds = recording_timestamp_seconds.max()
     delayed_transition_expected_time_seconds = (
         delayed_transition_indexes + 1 + np.arange(delayed_transition_indexes.size)
     ) / (
         (expected_transition_count + delayed_transition_indexes.size)
-        / (
-            transitions.recording_timestamp_seconds.max()
-            - transitions.recording_timestamp_seconds.min()
-        )
-    ) + transitions.recording_timestamp_seconds.min()
-    recording_delayed_transition_indexes = pd.Index(
-        transitions.recording_timestamp_seconds
-    ).get_indexer(delayed_transition_expected_time_seconds, method="nearest")
+        / (last_timestamp_seconds - first_timestamp_seconds)
+    ) + first_timestamp_seconds
+    recording_delayed_transition_indexes = _util.find_nearest_indexes(
+        recording_timestamp_seconds, delayed_transition_expected_time_seconds
+    )
 
     # In theory we could stop there, but we shouldn't, because the delayed transition
     # can be a few frames off (e.g. if there are spurious extra transitions at the
@@ -576,11 +737,7 @@ class _Generator:
             f" ~{transitions_interval_seconds.length:.6f} seconds",
             file=sys.stderr,
         )
-
-        transitions["time_since_previous_transition_seconds"] = (
-            transitions.recording_timestamp_seconds.diff()
-        )
-        transitions["valid"] = self._is_valid_transition(transitions)
+        self._warn_about_invalid_transitions(transitions)
 
         high_is_white = None
         intentionally_delayed_transitions = self._delayed_transitions(transitions)
@@ -618,16 +775,31 @@ class _Generator:
         )
 
     def _read_transitions(self):
-        return pd.read_csv(
+        edges = pd.read_csv(
             self._args.edges_csv_file,
             usecols=["recording_timestamp_seconds", "edge_is_rising"],
-        ).rename_axis(index="transition_index")
-
-    def _is_valid_transition(self, transitions):
-        valid = transitions.edge_is_rising.pipe(
-            lambda r: np.diff(r.values, prepend=not r.values[0])
+            dtype={"recording_timestamp_seconds": np.float64, "edge_is_rising": bool},
+        )
+        recording_timestamp_seconds = edges.recording_timestamp_seconds.values
+        edge_is_rising = edges.edge_is_rising.values
+        # Derive the columns from the raw arrays and build the DataFrame in one go, as
+        # opposed to adding the columns to an existing DataFrame one at a time.
+        return pd.DataFrame(
+            {
+                "recording_timestamp_seconds": recording_timestamp_seconds,
+                "edge_is_rising": edge_is_rising,
+                "time_since_previous_transition_seconds": np.diff(
+                    recording_timestamp_seconds, prepend=np.nan
+                ),
+                # A transition is valid if its edge direction differs from the
+                # previous one.
+                "valid": np.diff(edge_is_rising, prepend=not edge_is_rising[0]),
+            },
+            pd.RangeIndex(edges.index.size, name="transition_index"),
         )
-        invalid_transition_count = (~valid).sum()
+
+    def _warn_about_invalid_transitions(self, transitions):
+        invalid_transition_count = (~transitions.valid).sum()
         if invalid_transition_count > 0:
             print(
                 f"WARNING: data contains {invalid_transition_count} edges where the"
@@ -637,7 +809,6 @@ class _Generator:
                 ' as "invalid".',
                 file=sys.stderr,
             )
-        return valid
 
     def _delayed_transitions(self, transitions):
         intentionally_delayed_transitions = self._spec["delayed_transitions"]
@@ -702,28 +873,25 @@ class _Generator:
         falling_edge_offset_seconds = -falling_edge_lag_seconds / 2
         rising_edge_offset_seconds = falling_edge_lag_seconds / 2
 
-        transitions = transitions.copy()
-        transitions.loc[
-            ~transitions.edge_is_rising, "time_since_previous_transition_seconds"
-        ] += falling_edge_offset_seconds
-        transitions.loc[
-            transitions.edge_is_rising, "time_since_previous_transition_seconds"
-        ] += rising_edge_offset_seconds
-        return transitions, (falling_edge_offset_seconds, rising_edge_offset_seconds)
+        edge_offsets_seconds = np.where(
+            transitions.edge_is_rising,
+            rising_edge_offset_seconds,
+            falling_edge_offset_seconds,
+        )
+        return transitions.assign(
+            time_since_previous_transition_seconds=(
+                transitions.time_since_previous_transition_seconds
+                + edge_offsets_seconds
+            )
+        ), (falling_edge_offset_seconds, rising_edge_offset_seconds)
 
     def _round(self, transitions):
-        rounded_transitions = transitions.copy()
-        rounded_transitions.recording_timestamp_seconds = (
-            rounded_transitions.recording_timestamp_seconds.round(
+        return transitions.round({
+            "recording_timestamp_seconds": self._args.time_precision_seconds_decimals,
+            "time_since_previous_transition_seconds": (
                 self._args.time_precision_seconds_decimals
-            )
-        )
-        rounded_transitions.time_since_previous_transition_seconds = (
-            rounded_transitions.time_since_previous_transition_seconds.round(
-                self._args.time_precision_seconds_decimals
-            )
-        )
-        return rounded_transitions
+            ),
+        })
 
     def _write_csv(self, transitions, high_is_white):
         if not self._output_csv_file:
@@ -772,20 +940,19 @@ class _Generator:
         mean_time_between_transitions = (
             normal_transitions.time_since_previous_transition_seconds.mean()
         )
-        p05_duration = (
-            normal_transitions.time_since_previous_transition_seconds.quantile(0.005)
-        )
-        p95_duration = (
-            normal_transitions.time_since_previous_transition_seconds.quantile(0.995)
+        p05_duration, p95_duration = (
+            normal_transitions.time_since_previous_transition_seconds.quantile([
+                0.005, 0.995
+            ])
         )
+        # Equivalent to applying a threshold on `stats.zscore()`, but reuses the mean
+        # computed above. Note the z-score uses the population standard deviation.
         outliers_count = (
             np.abs(
-                stats.zscore(
-                    normal_transitions.loc[:, "time_since_previous_transition_seconds"],
-                    nan_policy="omit",
-                )
+                normal_transitions.time_since_previous_transition_seconds
+                - mean_time_between_transitions
             )
-            > 3
+            > 3 * normal_transitions.time_since_previous_transition_seconds.std(ddof=0)
         ).sum()
         mean_fps = 1 / mean_time_between_transitions
         found_intentionally_delayed_transitions = (
@@ -796,96 +963,123 @@ class _Generator:
         transitions_interval_seconds = _interval(
             transitions.recording_timestamp_seconds
         )
-        chart = _generate_chart(
-            rounded_transitions,
+        fine_print = [
+            (
+                "Chart and following notes"
+                f" {'include' if kept_first_transition else 'exclude'} the very"
+                " first transition and"
+                f" {'include' if kept_last_transition else 'exclude'} the very"
+                " last transition"
+            ),
+            (
+                "First transition recorded at"
+                f" {si_format(transitions_interval_seconds.left, 3)}s; last:"
+                f" {si_format(transitions_interval_seconds.right, 3)}s; length:"
+                f" {si_format(transitions_interval_seconds.length, 3)}s"
+            ),
+            (
+                f"Detected {transitions.index.size} transitions (expected"
+                f" {self._spec['transition_count']}); "
+                " expecting"
+                f" {len(self._spec['delayed_transitions'])} intentionally delayed"
+                " transitions"
+            ),
+            (
+                "Consistent timing differences between falling and rising edges"
+                " (i.e. between black vs. white transitions) have NOT been"
+                " compensated for"
+                if falling_rising_offsets_seconds is None
+                else (
+                    "Time since previous transition includes"
+                    f" {_si_format_plus(falling_rising_offsets_seconds[0], 3)}s"
+                    " correction in all falling edges and"
+                    f" {_si_format_plus(falling_rising_offsets_seconds[1], 3)}s"
+                    " correction in all rising edges"
+                )
+            ),
+            (
+                f"The following stats exclude {(~transitions.valid).sum()} invalid"
+                " transitions and the"
+                f" {found_intentionally_delayed_transitions} intentionally"
+                " delayed transitions that were found:"
+            ),
+            (
+                "Transition interval range:"
+                f" {si_format(shortest_transition_duration, 3)}s (at"
+                f" {si_format(shortest_transition_timestamp, 3)}s) to"
+                f" {si_format(longest_transition_duration, 3)}s (at"
+                f" {si_format(longest_transition_timestamp, 3)}s) - standard"
+                " deviation:"
+                f" {si_format(time_between_transitions_stddev_seconds, 3)}s"
+                f" - 99% of transitions are between {si_format(p05_duration, 3)}s"
+                f" and {si_format(p95_duration, 3)}s"
+            ),
+            (
+                "Mean time between transitions:"
+                f" {si_format(mean_time_between_transitions, 3)}s, i.e."
+                f" {mean_fps:.06f} FPS, which is"
+                f" {mean_fps/self._nominal_fps():.6f}x faster than expected (clock"
+                " skew)"
+            ),
+            (
+                f"{outliers_count} transitions are outliers (more than 3 standard"
+                " deviations away from the mean)"
+            ),
+            (
+                f"Generated by videojitter {_version.get_version()} -"
+                " github.com/dechamps/videojitter"
+            ),
+        ]
+        title = (
             f"{transitions.index.size} transitions at"
-            f" {self._nominal_fps():.3f} nominal FPS",
-            transitions_interval_seconds.left,
-            high_is_white,
-            getattr(
-                self._args,
-                "chart_start_seconds",
-                None,
-            ),
-            getattr(
-                self._args,
-                "chart_end_seconds",
-                None,
-            ),
-            self._args.chart_minimum_time_between_transitions_seconds,
-            self._args.chart_maximum_time_between_transitions_seconds,
-            np.round(
-                mean_time_between_transitions,
-                self._args.time_precision_seconds_decimals,
-            ),
-            fine_print=[
-                (
-                    "Chart and following notes"
-                    f" {'include' if kept_first_transition else 'exclude'} the very"
-                    " first transition and"
-                    f" {'include' if kept_last_transition else 'exclude'} the very"
-                    " last transition"
-                ),
-                (
-                    "First transition recorded at"
-                    f" {si_format(transitions_interval_seconds.left, 3)}s; last:"
-                    f" {si_format(transitions_interval_seconds.right, 3)}s; length:"
-                    f" {si_format(transitions_interval_seconds.length, 3)}s"
-                ),
-                (
-                    f"Detected {transitions.index.size} transitions (expected"
-                    f" {self._spec['transition_count']}); "
-                    " expecting"
-                    f" {len(self._spec['delayed_transitions'])} intentionally delayed"
-                    " transitions"
-                ),
-                (
-                    "Consistent timing differences between falling and rising edges"
-                    " (i.e. between black vs. white transitions) have NOT been"
-                    " compensated for"
-                    if falling_rising_offsets_seconds is None
-                    else (
-                        "Time since previous transition includes"
-                        f" {_si_format_plus(falling_rising_offsets_seconds[0], 3)}s"
-                        " correction in all falling edges and"
-                        f" {_si_format_plus(falling_rising_offsets_seconds[1], 3)}s"
-                        " correction in all rising edges"
-                    )
-                ),
-                (
-                    f"The following stats exclude {(~transitions.valid).sum()} invalid"
-                    " transitions and the"
-                    f" {found_intentionally_delayed_transitions} intentionally"
-                    " delayed transitions that were found:"
-                ),
-                (
-                    "Transition interval range:"
-                    f" {si_format(shortest_transition_duration, 3)}s (at"
-                    f" {si_format(shortest_transition_timestamp, 3)}s) to"
-                    f" {si_format(longest_transition_duration, 3)}s (at"
-                    f" {si_format(longest_transition_timestamp, 3)}s) - standard"
-                    " deviation:"
-                    f" {si_format(time_between_transitions_stddev_seconds, 3)}s"
-                    f" - 99% of transitions are between {si_format(p05_duration, 3)}s"
-                    f" and {si_format(p95_duration, 3)}s"
-                ),
-                (
-                    "Mean time between transitions:"
-                    f" {si_format(mean_time_between_transitions, 3)}s, i.e."
-                    f" {mean_fps:.06f} FPS, which is"
-                    f" {mean_fps/self._nominal_fps():.6f}x faster than expected (clock"
-                    " skew)"
-                ),
-                (
-                    f"{outliers_count} transitions are outliers (more than 3 standard"
-                    " deviations away from the mean)"
-                ),
-                (
-                    f"Generated by videojitter {_version.get_version()} -"
-                    " github.com/dechamps/videojitter"
-                ),
-            ],
+            f" {self._nominal_fps():.3f} nominal FPS"
         )
+        time_start_seconds = getattr(self._args, "chart_start_seconds", None)
+        time_end_seconds = getattr(self._args, "chart_end_seconds", None)
+        normal_rounded_transitions = _filter_normal_transitions(rounded_transitions)
+        # Fall back to the unbinned chart if there is nothing to bin, as that chart
+        # can still show invalid and intentionally delayed transitions.
+        if (
+            transitions.index.size
+            >= getattr(self._args, "chart_binning_threshold", np.inf)
+            and not normal_rounded_transitions.empty
+        ):
+            fine_print.insert(
+                1,
+                "Chart shows the minimum (bottom of shaded area), mean (line) and"
+                " maximum (top of shaded area) time since previous transition within"
+                f" {self._args.chart_bin_count} time bins, excluding invalid and"
+                " intentionally delayed transitions",
+            )
+            chart = _generate_binned_chart(
+                _bin_transitions(
+                    normal_rounded_transitions,
+                    transitions_interval_seconds.left,
+                    self._args.chart_bin_count,
+                ).round(self._args.time_precision_seconds_decimals),
+                title,
+                time_start_seconds,
+                time_end_seconds,
+                self._args.chart_minimum_time_between_transitions_seconds,
+                self._args.chart_maximum_time_between_transitions_seconds,
+                fine_print,
+            )
+        else:
+            chart = _generate_chart(
+                rounded_transitions,
+                title,
+                transitions_interval_seconds.left,
+                high_is_white,
+                time_start_seconds,
+                time_end_seconds,
+                self._args.chart_minimum_time_between_transitions_seconds,
+                self._args.chart_maximum_time_between_transitions_seconds,
+                np.round(
+                    mean_time_between_transitions,
+                    self._args.time_precision_seconds_decimals,
+                ),
+                fine_print,
+            )
         for output_chart_file in self._output_chart_files:
             chart.save(output_chart_file)
 
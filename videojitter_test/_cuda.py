@@ -0,0 +1,15 @@
+def is_cuda_available():
+    """Returns True if CuPy is installed and can see at least one CUDA device.
+
+    CuPy is an optional dependency that videojitter only uses for
+    `videojitter-generate-fake-recording --device cuda`, so test cases that exercise
+    it are skipped if this returns False."""
+    # pylint: disable=import-outside-toplevel,import-error
+    try:
+        import cupy
+    except ImportError:
+        return False
+    try:
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except cupy.cuda.runtime.CUDARuntimeError:
+        return False
@@ -0,0 +1,11 @@
+from videojitter_test import _pipeline
+
+
+async def videojitter_test(test_case):
+    with _pipeline.Pipeline(test_case) as pipeline:
+        await pipeline.run_generate_report(
+            "--chart-binning-threshold",
+            "100",
+            "--chart-bin-count",
+            "30",
+        )
@@ -0,0 +1,17 @@
+from videojitter_test import _cuda, _pipeline
+
+
+async def videojitter_test(test_case):
+    if not _cuda.is_cuda_available():
+        print("cuda_iir: skipped because CuPy or a CUDA device is not available")
+        return
+    with _pipeline.Pipeline(test_case) as pipeline:
+        await pipeline.run_generate_spec()
+        await pipeline.run_generate_fake_recording(
+            "--device",
+            "cuda",
+            "--gaussian-filter-method",
+            "iir",
+        )
+        await pipeline.run_analyze_recording()
+        await pipeline.run_generate_report()
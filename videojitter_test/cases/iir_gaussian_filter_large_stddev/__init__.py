@@ -0,0 +1,14 @@
+from videojitter_test import _pipeline
+
+
+async def videojitter_test(test_case):
+    with _pipeline.Pipeline(test_case) as pipeline:
+        await pipeline.run_generate_spec()
+        await pipeline.run_generate_fake_recording(
+            "--gaussian-filter-method",
+            "iir",
+            "--gaussian-filter-stddev-seconds",
+            0.005,
+        )
+        await pipeline.run_analyze_recording()
+        await pipeline.run_generate_report()